@@ -1,10 +1,17 @@
+import json
+
+COUNTRIES = ["United States", "China", "India", "United Kingdom", "Germany"]  # Example list
+
+# The list never changes between invocations, so serialize it once
+COUNTRIES_BODY = json.dumps(COUNTRIES)
+
 def handler(request):
-    countries = ["United States", "China", "India", "United Kingdom", "Germany"]  # Example list
     return {
         "statusCode": 200,
         "headers": {
             "Content-Type": "application/json",
-            "Access-Control-Allow-Origin": "*"
+            "Access-Control-Allow-Origin": "*",
+            "Cache-Control": "public, max-age=86400"
         },
-        "body": countries
+        "body": COUNTRIES_BODY
     }
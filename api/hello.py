@@ -1,7 +1,9 @@
-from http.server import BaseHTTPRequestHandler
+import logging
+
+logger = logging.getLogger(__name__)
 
 def handler(request):
-    print("Request received:", request)  # Debug print
+    logger.debug("Request received: %s", request)
     return {
         "body": "Hello from Python!"
     }
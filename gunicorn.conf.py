@@ -1,18 +1,23 @@
-import multiprocessing
+import os
 
 # Server socket
 bind = "0.0.0.0:8080"  # Match Railway's port
 backlog = 2048
 
-# Worker processes - using sync workers for simplicity
-workers = 4
-worker_class = 'sync'
-timeout = 120
+# Worker processes - gevent workers so requests waiting on upstream APIs
+# yield instead of pinning a whole process (gunicorn monkey-patches on boot).
+# Each worker multiplexes worker_connections requests, so a couple is enough;
+# the platform can override this through WEB_CONCURRENCY
+workers = int(os.getenv('WEB_CONCURRENCY', 2))
+worker_class = 'gevent'
+worker_connections = 1000
+timeout = 300
+keepalive = 5
 
 # Logging
 accesslog = '-'
 errorlog = '-'
-loglevel = 'debug'  # Increased log level for debugging
+loglevel = os.getenv('LOG_LEVEL', 'info')
 
 # Process naming
 proc_name = 'finder'
@@ -48,7 +53,7 @@ def pre_exec(server):
 
 def pre_request(worker, req):
     """Called just before a request."""
-    worker.log.debug("%s %s" % (req.method, req.path))
+    worker.log.debug("%s %s", req.method, req.path)
 
 def post_request(worker, req, environ, resp):
     """Called after a request."""